@@ -1,10 +1,14 @@
 from . import server
 import asyncio
 
+try:
+    import uvloop
+except ImportError:  # optional speedup, falls back to the default event loop
+    uvloop = None
+
 def main():
     """Main entry point for the package."""
-    asyncio.run(server.main())
+    asyncio.run(server.main(), loop_factory=uvloop.new_event_loop if uvloop is not None else None)
 
 # Optionally expose other important items at package level
 __all__ = ['main', 'server']
-
@@ -1,43 +1,136 @@
 import asyncio
-import base64
+import atexit
 import os
 import logging
+import logging.handlers
 import sys
-from enum import Enum
+import threading
 import json
-from typing import List, Optional, Tuple
-from datetime import datetime
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from queue import SimpleQueue
+from typing import List, Optional
 
 import mcp.types as types
-from mcp.server import NotificationOptions, Server  # , stdio_server
+from mcp.server import Server
 import mcp.server.stdio
-from pydantic import BaseModel, Field, AnyUrl
+from pydantic import BaseModel, Field
 from spotipy import SpotifyException
 
 from . import spotify_api
-from .utils import normalize_redirect_uri
+from .utils import dumps, loads
+
+
+def setup_logger() -> logging.Logger:
+    # stdout carries the MCP protocol, so logs go to stderr; SPOTIFY_MCP_LOG_LEVEL=WARNING silences per-call logs
+    logger = logging.getLogger("spotify_mcp")
+    if not logger.handlers:
+        handler = logging.StreamHandler(sys.stderr)
+        handler.setFormatter(logging.Formatter("[%(levelname)s] %(message)s"))
+        # records are written out by a background thread, so logging never blocks a handler on stderr
+        log_queue = SimpleQueue()
+        listener = logging.handlers.QueueListener(log_queue, handler)
+        listener.start()
+        atexit.register(listener.stop)
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        logger.propagate = False
+    level = os.getenv("SPOTIFY_MCP_LOG_LEVEL", "INFO").upper()
+    if level in logging.getLevelNamesMapping():
+        logger.setLevel(level)
+    else:
+        # an unknown level must not keep the server from starting
+        logger.setLevel(logging.INFO)
+        logger.warning("Ignoring invalid SPOTIFY_MCP_LOG_LEVEL=%r, using INFO", level)
+    return logger
 
 
-def setup_logger():
-    class Logger:
-        def info(self, message):
-            print(f"[INFO] {message}", file=sys.stderr)
+logger = setup_logger()
 
-        def error(self, message):
-            print(f"[ERROR] {message}", file=sys.stderr)
+# Built on first use, so the server starts (and lists tools) without waiting on OAuth setup
+_spotify_client: Optional[spotify_api.Client] = None
+_spotify_client_lock = threading.Lock()
 
-    return Logger()
 
+def get_spotify_client() -> spotify_api.Client:
+    global _spotify_client
+    if _spotify_client is None:
+        with _spotify_client_lock:
+            if _spotify_client is None:
+                _spotify_client = spotify_api.Client(logger)
+    return _spotify_client
 
-logger = setup_logger()
-# Normalize the redirect URI to meet Spotify's requirements
-if spotify_api.REDIRECT_URI:
-    spotify_api.REDIRECT_URI = normalize_redirect_uri(spotify_api.REDIRECT_URI)
-spotify_client = spotify_api.Client(logger)
 
 server = Server("spotify-mcp")
 
+# Follow-up hints for common Spotify API failures, keyed by HTTP status
+SPOTIFY_ERROR_HINTS = {
+    401: "The access token is invalid or expired; re-authenticate with Spotify.",
+    403: "Spotify refused the request; this usually means Premium is required or a scope is missing.",
+    404: "The requested item or active device was not found; check the ID/URI and that Spotify is open.",
+    429: "Spotify's rate limit was hit; wait a moment before retrying.",
+    500: "Spotify is temporarily unavailable; try again shortly.",
+    502: "Spotify is temporarily unavailable; try again shortly.",
+    503: "Spotify is temporarily unavailable; try again shortly.",
+}
+
+
+def text_response(text: str) -> list[types.TextContent]:
+    """Wraps text as a tool result."""
+    return [types.TextContent(type="text", text=text)]
+
+
+# Pre-built responses for invalid arguments. Handlers return these shared objects as-is, so they must not be mutated
+QUEUE_TRACK_ID_REQUIRED = text_response("track_id or track_ids is required for add action")
+TRACK_IDS_INVALID = text_response("Error: track_ids must be a list or a valid JSON array.")
+TRACK_IDS_REQUIRED = text_response("track_ids is required.")
+GET_TRACKS_PLAYLIST_ID_REQUIRED = text_response("playlist_id is required for get_tracks action.")
+CHANGE_DETAILS_PLAYLIST_ID_REQUIRED = text_response("playlist_id is required for change_details action.")
+CHANGE_DETAILS_FIELDS_REQUIRED = text_response("At least one of name, description, public, or collaborative is required.")
+CREATE_NAME_REQUIRED = text_response("name is required for create action.")
+
+# Pre-built responses for actions that succeed with a fixed message, shared the same way
+NO_TRACK_PLAYING = text_response("No track playing.")
+PLAYBACK_STARTING = text_response("Playback starting.")
+PLAYBACK_PAUSED = text_response("Playback paused.")
+TRACK_SKIPPED = text_response("Skipped to next track.")
+TRACKS_QUEUED = text_response("Tracks added to queue.")
+TRACK_QUEUED = text_response("Track added to queue.")
+PLAYLIST_TRACKS_ADDED = text_response("Tracks added to playlist.")
+PLAYLIST_TRACKS_REMOVED = text_response("Tracks removed from playlist.")
+PLAYLIST_DETAILS_CHANGED = text_response("Playlist details changed.")
+
+
+def json_response(obj) -> list[types.TextContent]:
+    """Serializes obj as a JSON tool result."""
+    return text_response(dumps(obj))
+
+
+async def fetch_json(func, /, *args, **kwargs) -> list[types.TextContent]:
+    """
+    Runs a blocking Spotify client call in a worker thread and builds its JSON result in that same thread,
+    so parsing and encoding large payloads (e.g. long playlists) never stalls the event loop.
+    """
+    return await asyncio.to_thread(lambda: json_response(func(*args, **kwargs)))
+
+
+class InvalidTrackIdsError(ValueError):
+    """Raised when the track_ids argument is a string that is not a valid JSON array."""
+
+
+def load_track_ids(arguments: dict):
+    """
+    Returns arguments["track_ids"], decoding it first if the client sent the list as a JSON string.
+    An invalid string raises InvalidTrackIdsError, which handle_call_tool reports as TRACK_IDS_INVALID.
+    """
+    track_ids = arguments.get("track_ids")
+    if isinstance(track_ids, str):
+        if not track_ids.lstrip().startswith("["):
+            return [track_ids]  # a lone ID or URI, no JSON to parse
+        try:
+            track_ids = loads(track_ids)  # Convert JSON string to Python list
+        except json.JSONDecodeError as e:
+            raise InvalidTrackIdsError(str(e)) from e
+    return track_ids
+
 
 # options =
 class ToolModel(BaseModel):
@@ -64,9 +157,11 @@ class Playback(ToolModel):
 
 
 class Queue(ToolModel):
-    """Manage the playback queue - get the queue or add tracks."""
+    """Manage the playback queue - get the queue or add one or more tracks."""
     action: str = Field(description="Action to perform: 'add' or 'get'.")
     track_id: Optional[str] = Field(default=None, description="Track ID to add to queue (required for add action)")
+    track_ids: Optional[List[str]] = Field(default=None, description="Track IDs to add to queue in order, " +
+                                                                     "instead of track_id (for add action)")
 
 
 class GetInfo(ToolModel):
@@ -76,6 +171,11 @@ class GetInfo(ToolModel):
                                       "If 'artist', returns albums and top tracks.")
 
 
+class GetTracksInfo(ToolModel):
+    """Get detailed information about several Spotify tracks at once."""
+    track_ids: List[str] = Field(description="List of track IDs or URIs to get information about.")
+
+
 class Search(ToolModel):
     """Search for tracks, albums, artists, or playlists on Spotify."""
     query: str = Field(description="query term")
@@ -101,6 +201,7 @@ class Playlist(ToolModel):
     name: Optional[str] = Field(default=None, description="Name for the playlist (required for create and change_details).")
     description: Optional[str] = Field(default=None, description="Description for the playlist.")
     public: Optional[bool] = Field(default=True, description="Whether the playlist should be public (for create action).")
+    limit: Optional[int] = Field(default=100, description="Max number of tracks to return (for get_tracks action).")
 
 
 @server.list_prompts()
@@ -113,20 +214,213 @@ async def handle_list_resources() -> list[types.Resource]:
     return []
 
 
+# Tool schemas never change at runtime, so they are generated once rather than on every list_tools request
+TOOLS = [
+    Playback.as_tool(),
+    Search.as_tool(),
+    Queue.as_tool(),
+    GetInfo.as_tool(),
+    GetTracksInfo.as_tool(),
+    Playlist.as_tool(),
+]
+
+
 @server.list_tools()
 async def handle_list_tools() -> list[types.Tool]:
     """List available tools."""
-    logger.info("Listing available tools")
+    logger.debug("Listing available tools")
     # await server.request_context.session.send_notification("are you recieving this notification?")
-    tools = [
-        Playback.as_tool(),
-        Search.as_tool(),
-        Queue.as_tool(),
-        GetInfo.as_tool(),
-        Playlist.as_tool(),
-    ]
-    logger.info(f"Available tools: {[tool.name for tool in tools]}")
-    return tools
+    return TOOLS
+
+
+async def playback_get(arguments: dict) -> list[types.TextContent]:
+    curr_track = await asyncio.to_thread(get_spotify_client().get_current_track)
+    if curr_track:
+        return json_response(curr_track)
+    return NO_TRACK_PLAYING
+
+
+async def playback_start(arguments: dict) -> list[types.TextContent]:
+    await asyncio.to_thread(get_spotify_client().start_playback, spotify_uri=arguments.get("spotify_uri"))
+    return PLAYBACK_STARTING
+
+
+async def playback_pause(arguments: dict) -> list[types.TextContent]:
+    await asyncio.to_thread(get_spotify_client().pause_playback)
+    return PLAYBACK_PAUSED
+
+
+async def playback_skip(arguments: dict) -> list[types.TextContent]:
+    num_skips = int(arguments.get("num_skips", 1))
+    skipped = await asyncio.to_thread(get_spotify_client().skip_track, n=num_skips)
+    if skipped != num_skips:
+        return text_response(f"Skipped {skipped} track(s) instead of the {num_skips} requested; "
+                             f"num_skips must be between 1 and {spotify_api.MAX_SKIPS}.")
+    return TRACK_SKIPPED
+
+
+async def queue_add(arguments: dict) -> list[types.TextContent]:
+    track_ids = load_track_ids(arguments)
+    if track_ids:
+        await asyncio.to_thread(get_spotify_client().add_tracks_to_queue, track_ids)
+        return TRACKS_QUEUED
+    track_id = arguments.get("track_id")
+    if not track_id:
+        logger.error("track_id or track_ids is required for add to queue.")
+        return QUEUE_TRACK_ID_REQUIRED
+    await asyncio.to_thread(get_spotify_client().add_to_queue, track_id)
+    return TRACK_QUEUED
+
+
+async def queue_get(arguments: dict) -> list[types.TextContent]:
+    queue = await asyncio.to_thread(get_spotify_client().get_queue)
+    return json_response(queue)
+
+
+async def search(arguments: dict) -> list[types.TextContent]:
+    search_results = await asyncio.to_thread(
+        get_spotify_client().search,
+        query=arguments.get("query", ""),
+        qtype=arguments.get("qtype", "track"),
+        limit=arguments.get("limit", 10)
+    )
+    return json_response(search_results)
+
+
+async def get_info(arguments: dict) -> list[types.TextContent]:
+    return await fetch_json(
+        get_spotify_client().get_info,
+        item_uri=arguments.get("item_uri")
+    )
+
+
+async def get_tracks_info(arguments: dict) -> list[types.TextContent]:
+    track_ids = load_track_ids(arguments)
+    if not track_ids:
+        return TRACK_IDS_REQUIRED
+    return await fetch_json(get_spotify_client().get_tracks_info, track_ids)
+
+
+async def playlist_get(arguments: dict) -> list[types.TextContent]:
+    playlists = await asyncio.to_thread(get_spotify_client().get_current_user_playlists)
+    return json_response(playlists)
+
+
+async def playlist_get_tracks(arguments: dict) -> list[types.TextContent]:
+    playlist_id = arguments.get("playlist_id")
+    if not playlist_id:
+        logger.error("playlist_id is required for get_tracks action.")
+        return GET_TRACKS_PLAYLIST_ID_REQUIRED
+    # "limit": null is allowed by the schema, and Spotify rejects a limit below 1
+    limit = arguments.get("limit")
+    limit = 100 if limit is None else max(1, int(limit))
+    return await fetch_json(get_spotify_client().get_playlist_tracks, playlist_id, limit=limit)
+
+
+async def playlist_add_tracks(arguments: dict) -> list[types.TextContent]:
+    playlist_id = arguments.get("playlist_id")
+    track_ids = load_track_ids(arguments)
+    # track_ids can run to hundreds of IDs, so only its size is logged
+    logger.debug("Adding %d tracks to playlist %s", len(track_ids or ()), playlist_id)
+    await asyncio.to_thread(
+        get_spotify_client().add_tracks_to_playlist,
+        playlist_id=playlist_id,
+        track_ids=track_ids
+    )
+    return PLAYLIST_TRACKS_ADDED
+
+
+async def playlist_remove_tracks(arguments: dict) -> list[types.TextContent]:
+    playlist_id = arguments.get("playlist_id")
+    track_ids = load_track_ids(arguments)
+    logger.debug("Removing %d tracks from playlist %s", len(track_ids or ()), playlist_id)
+    await asyncio.to_thread(
+        get_spotify_client().remove_tracks_from_playlist,
+        playlist_id=playlist_id,
+        track_ids=track_ids
+    )
+    return PLAYLIST_TRACKS_REMOVED
+
+
+async def playlist_change_details(arguments: dict) -> list[types.TextContent]:
+    playlist_id = arguments.get("playlist_id")
+    name = arguments.get("name")
+    description = arguments.get("description")
+    if not playlist_id:
+        logger.error("playlist_id is required for change_details action.")
+        return CHANGE_DETAILS_PLAYLIST_ID_REQUIRED
+    if not name and not description:
+        logger.error("At least one of name, description or public is required.")
+        return CHANGE_DETAILS_FIELDS_REQUIRED
+
+    await asyncio.to_thread(
+        get_spotify_client().change_playlist_details,
+        playlist_id=playlist_id,
+        name=name,
+        description=description
+    )
+    return PLAYLIST_DETAILS_CHANGED
+
+
+async def playlist_create(arguments: dict) -> list[types.TextContent]:
+    name = arguments.get("name")
+    if not name:
+        logger.error("name is required for create action.")
+        return CREATE_NAME_REQUIRED
+
+    playlist = await asyncio.to_thread(
+        get_spotify_client().create_playlist,
+        name=name,
+        description=arguments.get("description"),
+        public=arguments.get("public", True)
+    )
+    return json_response(playlist)
+
+
+# Action handlers for the Playback, Queue and Playlist tools, looked up by the 'action' argument
+PLAYBACK_ACTIONS = {
+    "get": playback_get,
+    "start": playback_start,
+    "pause": playback_pause,
+    "skip": playback_skip,
+}
+QUEUE_ACTIONS = {
+    "add": queue_add,
+    "get": queue_get,
+}
+PLAYLIST_ACTIONS = {
+    "get": playlist_get,
+    "get_tracks": playlist_get_tracks,
+    "add_tracks": playlist_add_tracks,
+    "remove_tracks": playlist_remove_tracks,
+    "change_details": playlist_change_details,
+    "create": playlist_create,
+}
+
+
+def dispatch_action(tool: str, actions: dict):
+    """Returns a tool handler that forwards to actions[arguments['action']]."""
+    supported = ", ".join(actions)
+
+    async def handler(arguments: dict) -> list[types.TextContent]:
+        action = arguments.get("action")
+        action_handler = actions.get(action)
+        if action_handler is None:
+            return text_response(f"Unknown {tool.lower()} action: {action}. Supported actions are: {supported}.")
+        return await action_handler(arguments)
+
+    return handler
+
+
+# Tool handlers keyed by the names advertised in TOOLS
+TOOL_HANDLERS = {
+    "SpotifyPlayback": dispatch_action("Playback", PLAYBACK_ACTIONS),
+    "SpotifySearch": search,
+    "SpotifyQueue": dispatch_action("Queue", QUEUE_ACTIONS),
+    "SpotifyGetInfo": get_info,
+    "SpotifyGetTracksInfo": get_tracks_info,
+    "SpotifyPlaylist": dispatch_action("Playlist", PLAYLIST_ACTIONS),
+}
 
 
 @server.call_tool()
@@ -134,248 +428,38 @@ async def handle_call_tool(
         name: str, arguments: dict | None
 ) -> list[types.TextContent | types.ImageContent | types.EmbeddedResource]:
     """Handle tool execution requests."""
-    logger.info(f"Tool called: {name} with arguments: {arguments}")
-    assert name[:7] == "Spotify", f"Unknown tool: {name}"
+    arguments = arguments or {}
+    # arguments can carry hundreds of track IDs, so only their names are logged; handlers log item counts
+    logger.debug("Tool called: %s action=%s args=%s", name, arguments.get("action"), list(arguments))
+    handler = TOOL_HANDLERS.get(name)
+    if handler is None:
+        error_msg = f"Unknown tool: {name}"
+        logger.error(error_msg)
+        return text_response(error_msg)
     try:
-        match name[7:]:
-            case "Playback":
-                action = arguments.get("action")
-                match action:
-                    case "get":
-                        logger.info("Attempting to get current track")
-                        curr_track = spotify_client.get_current_track()
-                        if curr_track:
-                            logger.info(f"Current track retrieved: {curr_track.get('name', 'Unknown')}")
-                            return [types.TextContent(
-                                type="text",
-                                text=json.dumps(curr_track, indent=2)
-                            )]
-                        logger.info("No track currently playing")
-                        return [types.TextContent(
-                            type="text",
-                            text="No track playing."
-                        )]
-                    case "start":
-                        logger.info(f"Starting playback with arguments: {arguments}")
-                        spotify_client.start_playback(spotify_uri=arguments.get("spotify_uri"))
-                        logger.info("Playback started successfully")
-                        return [types.TextContent(
-                            type="text",
-                            text="Playback starting."
-                        )]
-                    case "pause":
-                        logger.info("Attempting to pause playback")
-                        spotify_client.pause_playback()
-                        logger.info("Playback paused successfully")
-                        return [types.TextContent(
-                            type="text",
-                            text="Playback paused."
-                        )]
-                    case "skip":
-                        num_skips = int(arguments.get("num_skips", 1))
-                        logger.info(f"Skipping {num_skips} tracks.")
-                        spotify_client.skip_track(n=num_skips)
-                        return [types.TextContent(
-                            type="text",
-                            text="Skipped to next track."
-                        )]
-
-            case "Search":
-                logger.info(f"Performing search with arguments: {arguments}")
-                search_results = spotify_client.search(
-                    query=arguments.get("query", ""),
-                    qtype=arguments.get("qtype", "track"),
-                    limit=arguments.get("limit", 10)
-                )
-                logger.info("Search completed successfully.")
-                return [types.TextContent(
-                    type="text",
-                    text=json.dumps(search_results, indent=2)
-                )]
-
-            case "Queue":
-                logger.info(f"Queue operation with arguments: {arguments}")
-                action = arguments.get("action")
-
-                match action:
-                    case "add":
-                        track_id = arguments.get("track_id")
-                        if not track_id:
-                            logger.error("track_id is required for add to queue.")
-                            return [types.TextContent(
-                                type="text",
-                                text="track_id is required for add action"
-                            )]
-                        spotify_client.add_to_queue(track_id)
-                        return [types.TextContent(
-                            type="text",
-                            text=f"Track added to queue."
-                        )]
-
-                    case "get":
-                        queue = spotify_client.get_queue()
-                        return [types.TextContent(
-                            type="text",
-                            text=json.dumps(queue, indent=2)
-                        )]
-
-                    case _:
-                        return [types.TextContent(
-                            type="text",
-                            text=f"Unknown queue action: {action}. Supported actions are: add, remove, and get."
-                        )]
-
-            case "GetInfo":
-                logger.info(f"Getting item info with arguments: {arguments}")
-                item_info = spotify_client.get_info(
-                    item_uri=arguments.get("item_uri")
-                )
-                return [types.TextContent(
-                    type="text",
-                    text=json.dumps(item_info, indent=2)
-                )]
-
-            case "Playlist":
-                logger.info(f"Playlist operation with arguments: {arguments}")
-                action = arguments.get("action")
-                match action:
-                    case "get":
-                        logger.info(f"Getting current user's playlists with arguments: {arguments}")
-                        playlists = spotify_client.get_current_user_playlists()
-                        return [types.TextContent(
-                            type="text",
-                            text=json.dumps(playlists, indent=2)
-                        )]
-                    case "get_tracks":
-                        logger.info(f"Getting tracks in playlist with arguments: {arguments}")
-                        if not arguments.get("playlist_id"):
-                            logger.error("playlist_id is required for get_tracks action.")
-                            return [types.TextContent(
-                                type="text",
-                                text="playlist_id is required for get_tracks action."
-                            )]
-                        tracks = spotify_client.get_playlist_tracks(arguments.get("playlist_id"))
-                        return [types.TextContent(
-                            type="text",
-                            text=json.dumps(tracks, indent=2)
-                        )]
-                    case "add_tracks":
-                        logger.info(f"Adding tracks to playlist with arguments: {arguments}")
-                        track_ids = arguments.get("track_ids")
-                        if isinstance(track_ids, str):
-                            try:
-                                track_ids = json.loads(track_ids)  # Convert JSON string to Python list
-                            except json.JSONDecodeError:
-                                logger.error("track_ids must be a list or a valid JSON array.")
-                                return [types.TextContent(
-                                    type="text",
-                                    text="Error: track_ids must be a list or a valid JSON array."
-                                )]
-
-                        spotify_client.add_tracks_to_playlist(
-                            playlist_id=arguments.get("playlist_id"),
-                            track_ids=track_ids
-                        )
-                        return [types.TextContent(
-                            type="text",
-                            text="Tracks added to playlist."
-                        )]
-                    case "remove_tracks":
-                        logger.info(f"Removing tracks from playlist with arguments: {arguments}")
-                        track_ids = arguments.get("track_ids")
-                        if isinstance(track_ids, str):
-                            try:
-                                track_ids = json.loads(track_ids)  # Convert JSON string to Python list
-                            except json.JSONDecodeError:
-                                logger.error("track_ids must be a list or a valid JSON array.")
-                                return [types.TextContent(
-                                    type="text",
-                                    text="Error: track_ids must be a list or a valid JSON array."
-                                )]
-
-                        spotify_client.remove_tracks_from_playlist(
-                            playlist_id=arguments.get("playlist_id"),
-                            track_ids=track_ids
-                        )
-                        return [types.TextContent(
-                            type="text",
-                            text="Tracks removed from playlist."
-                        )]
-
-                    case "change_details":
-                        logger.info(f"Changing playlist details with arguments: {arguments}")
-                        if not arguments.get("playlist_id"):
-                            logger.error("playlist_id is required for change_details action.")
-                            return [types.TextContent(
-                                type="text",
-                                text="playlist_id is required for change_details action."
-                            )]
-                        if not arguments.get("name") and not arguments.get("description"):
-                            logger.error("At least one of name, description or public is required.")
-                            return [types.TextContent(
-                                type="text",
-                                text="At least one of name, description, public, or collaborative is required."
-                            )]
-
-                        spotify_client.change_playlist_details(
-                            playlist_id=arguments.get("playlist_id"),
-                            name=arguments.get("name"),
-                            description=arguments.get("description")
-                        )
-                        return [types.TextContent(
-                            type="text",
-                            text="Playlist details changed."
-                        )]
-
-                    case "create":
-                        logger.info(f"Creating playlist with arguments: {arguments}")
-                        if not arguments.get("name"):
-                            logger.error("name is required for create action.")
-                            return [types.TextContent(
-                                type="text",
-                                text="name is required for create action."
-                            )]
-                        
-                        playlist = spotify_client.create_playlist(
-                            name=arguments.get("name"),
-                            description=arguments.get("description"),
-                            public=arguments.get("public", True)
-                        )
-                        return [types.TextContent(
-                            type="text",
-                            text=json.dumps(playlist, indent=2)
-                        )]
-
-                    case _:
-                        return [types.TextContent(
-                            type="text",
-                            text=f"Unknown playlist action: {action}."
-                                 "Supported actions are: get, get_tracks, add_tracks, remove_tracks, change_details, create."
-                        )]
-            case _:
-                error_msg = f"Unknown tool: {name}"
-                logger.error(error_msg)
-                return [types.TextContent(
-                    type="text",
-                    text=error_msg
-                )]
+        return await handler(arguments)
+    except InvalidTrackIdsError:
+        logger.error("track_ids must be a list or a valid JSON array.")
+        return TRACK_IDS_INVALID
     except SpotifyException as se:
         error_msg = f"Spotify Client error occurred: {str(se)}"
         logger.error(error_msg)
-        return [types.TextContent(
-            type="text",
-            text=f"An error occurred with the Spotify Client: {str(se)}"
-        )]
+        text = f"An error occurred with the Spotify Client: {str(se)}"
+        hint = SPOTIFY_ERROR_HINTS.get(se.http_status)
+        if hint:
+            text = f"{text} {hint}"
+        return text_response(text)
     except Exception as e:
         error_msg = f"Unexpected error occurred: {str(e)}"
         logger.error(error_msg)
-        return [types.TextContent(
-            type="text",
-            text=error_msg
-        )]
+        return text_response(error_msg)
 
 
 async def main():
+    # Tool calls are handled concurrently but block in worker threads; size the default executor to the
+    # HTTP connection pool so a burst of calls isn't throttled by asyncio's CPU-count based default.
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=spotify_api.POOL_MAXSIZE, thread_name_prefix="spotify"))
     try:
         async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
             await server.run(
@@ -384,5 +468,5 @@ async def main():
                 server.create_initialization_options()
             )
     except Exception as e:
-        logger.error(f"Server error occurred: {str(e)}")
+        logger.error("Server error occurred: %s", e)
         raise
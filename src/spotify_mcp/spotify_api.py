@@ -1,9 +1,15 @@
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, List
 
+import requests
 import spotipy
+import urllib3
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import MaxRetryError, ResponseError
+from spotipy import SpotifyException
 from spotipy.cache_handler import CacheFileHandler
 from spotipy.oauth2 import SpotifyOAuth
 
@@ -27,6 +33,178 @@ SCOPES = ["user-read-currently-playing", "user-read-playback-state", "user-read-
           "user-library-modify", "user-library-read",  # library
           ]
 
+# Messages for errors raised from several call sites. Exceptions themselves are built per raise,
+# since a shared instance would accumulate tracebacks across calls.
+NO_ACTIVE_DEVICE_MSG = "No active device. Is Spotify open?"
+NO_PLAYLIST_ID_MSG = "No playlist ID provided."
+NO_TRACK_IDS_MSG = "No track IDs provided."
+
+# Shared pool for fanning out independent Spotify requests within a single call
+_executor = ThreadPoolExecutor(max_workers=8)
+
+# Max # items Spotify returns per page of playlist items
+PAGE_SIZE = 100
+# Pages of a long playlist fetched at once; kept low so a 10k-track playlist doesn't trip the rate limit
+MAX_CONCURRENT_PAGES = 4
+_page_executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_PAGES)
+# Max # tracks skipped by a single skip action
+MAX_SKIPS = 50
+# Max # IDs accepted by Spotify's multiple-tracks endpoint
+TRACKS_BATCH_SIZE = 50
+# Max # items Spotify accepts per playlist add/remove request
+PLAYLIST_WRITE_BATCH_SIZE = 100
+
+# `fields` filters restricting playlist responses to what utils.parse_track/parse_playlist read,
+# which drops album art, available_markets, etc. from every track
+TRACK_FIELDS = "name,id,is_playable,artists(name)"
+PLAYLIST_ITEMS_FIELDS = f"items(track({TRACK_FIELDS})),total"
+PLAYLIST_FIELDS = f"name,id,description,owner(display_name),tracks(total,items(track({TRACK_FIELDS})))"
+# Resolving tracks against the user's own market makes Spotify report is_playable instead of
+# the (often ~200 entry) available_markets list on every track and album
+MARKET = "from_token"
+
+# How long cached reads stay fresh, in seconds. Track/album metadata is effectively static, while
+# playlists can be edited from other clients at any time.
+INFO_TTLS = {'track': 3600, 'album': 3600, 'artist': 600, 'playlist': 60}
+PLAYLIST_TTL = 60
+# Matches the max-age Spotify itself sends on search responses
+SEARCH_TTL = 120
+# Playback state changes under us (other devices, tracks ending), so it is only reused across
+# back-to-back tool calls, e.g. "skip" followed right away by "what's playing?"
+CURRENT_TRACK_TTL = 2
+# The device list is checked before every playback call but rarely changes mid-conversation
+DEVICES_TTL = 10
+
+
+def _info_ttl(item_uri: str) -> float:
+    return INFO_TTLS.get(item_uri.split(':')[1], PLAYLIST_TTL)
+
+
+# Max # pooled connections to Spotify, i.e. how many requests can be in flight at once
+POOL_MAXSIZE = 32
+# Client-side cap on requests per second, so bursts of tool calls are smoothed out rather than
+# tripping Spotify's rate limit and its long Retry-After waits; overridden by SPOTIFY_RPS, where 0 disables it
+DEFAULT_REQUESTS_PER_SECOND = 10.0
+REQUEST_BURST = 10
+
+# Retry policy for rate-limited (429) and transient server errors
+MAX_RETRIES = 5
+RETRY_BACKOFF_FACTOR = 0.5
+# Longest wait, in seconds, between attempts; a 429/503 asking for more than this fails fast instead
+MAX_RETRY_WAIT = 30
+
+
+def _with_progress(error: Exception, progress: str) -> Exception:
+    """
+    Returns error with progress prepended to its message, for writes that fail partway through.
+    A SpotifyException keeps its status, so handle_call_tool still adds its hint; other errors are returned as is.
+    """
+    if isinstance(error, SpotifyException):
+        return SpotifyException(error.http_status, error.code, f"{progress}: {error.msg}",
+                                reason=error.reason, headers=error.headers)
+    return error
+
+
+class _CappedRetry(urllib3.Retry):
+    """
+    Retry that gives up on a response whose Retry-After exceeds MAX_RETRY_WAIT, rather than blocking
+    a worker thread for as long as Spotify asks (which can be hours after heavy use).
+    """
+
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        # urllib3 honours Retry-After on 503 as well as 429, so the cap applies to any response carrying one
+        if response is not None:
+            retry_after = self.get_retry_after(response)
+            if retry_after is not None and retry_after > MAX_RETRY_WAIT:
+                reason = ResponseError(f"status {response.status}, Retry-After {retry_after:.0f}s")
+                raise MaxRetryError(_pool, url, reason) from reason
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+
+
+class _MemoizedCacheFileHandler(CacheFileHandler):
+    """
+    CacheFileHandler that keeps the token in memory once it has been read.
+    spotipy looks the token up before every request, so this avoids re-reading the cache file each time;
+    refreshed tokens are still written through to disk for the next process.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._token_info = None
+
+    def get_cached_token(self):
+        if self._token_info is None:
+            self._token_info = super().get_cached_token()
+        return self._token_info
+
+    def save_token_to_cache(self, token_info):
+        self._token_info = token_info
+        super().save_token_to_cache(token_info)
+
+
+class _ThrottledAdapter(HTTPAdapter):
+    """HTTPAdapter that waits on a shared RateLimiter before each request."""
+
+    def __init__(self, limiter: utils.RateLimiter, **kwargs):
+        self.limiter = limiter
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        self.limiter.acquire()
+        return super().send(request, **kwargs)
+
+
+def _requests_per_second(logger: logging.Logger) -> float:
+    """
+    Reads SPOTIFY_RPS when the client is built rather than at import, so a bad value is
+    logged and replaced with the default instead of stopping the server before it starts.
+    """
+    value = os.getenv("SPOTIFY_RPS")
+    if value is None:
+        return DEFAULT_REQUESTS_PER_SECOND
+    try:
+        return float(value)
+    except ValueError:
+        logger.warning("Ignoring invalid SPOTIFY_RPS=%r, using %s", value, DEFAULT_REQUESTS_PER_SECOND)
+        return DEFAULT_REQUESTS_PER_SECOND
+
+
+def _build_session(logger: logging.Logger) -> requests.Session:
+    """
+    Build a keep-alive session for all Spotify traffic.
+    The connection pool is sized for concurrent tool calls so sockets are reused instead of
+    being discarded and re-handshaked once more than a handful of requests are in flight.
+    Requests are throttled client-side to SPOTIFY_RPS per second, and rate-limited and transient
+    failures are retried at the HTTP layer, honoring Retry-After.
+    """
+    retry = _CappedRetry(
+        total=MAX_RETRIES,
+        connect=None,
+        read=False,
+        allowed_methods=frozenset(['GET', 'POST', 'PUT', 'DELETE']),
+        status=MAX_RETRIES,
+        backoff_factor=RETRY_BACKOFF_FACTOR,
+        backoff_max=MAX_RETRY_WAIT,
+        status_forcelist=spotipy.Spotify.default_retry_codes,
+        respect_retry_after_header=True)
+    requests_per_second = _requests_per_second(logger)
+    if requests_per_second > 0:
+        adapter = _ThrottledAdapter(utils.RateLimiter(requests_per_second, burst=REQUEST_BURST),
+                                    pool_connections=4, pool_maxsize=POOL_MAXSIZE, max_retries=retry)
+    else:
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=POOL_MAXSIZE, max_retries=retry)
+
+    session = requests.Session()
+    session.mount('https://', adapter)
+    if utils.orjson is not None:
+        session.hooks['response'].append(utils.orjson_response_hook)
+    return session
+
+
+def _device_id(device: Optional[Dict]) -> Optional[str]:
+    """Returns the ID of a device picked by utils.validate, or None to target the active device."""
+    return device.get('id') if device else None
+
 
 class Client:
     def __init__(self, logger: logging.Logger):
@@ -36,26 +214,35 @@ class Client:
         scope = "user-library-read,user-read-playback-state,user-modify-playback-state,user-read-currently-playing,playlist-read-private,playlist-read-collaborative,playlist-modify-private,playlist-modify-public"
 
         try:
+            session = _build_session(logger)
             self.sp = spotipy.Spotify(auth_manager=SpotifyOAuth(
                 scope=scope,
                 client_id=CLIENT_ID,
                 client_secret=CLIENT_SECRET,
-                redirect_uri=REDIRECT_URI))
+                redirect_uri=REDIRECT_URI,
+                cache_handler=_MemoizedCacheFileHandler(),
+                requests_session=session),
+                requests_session=session)
 
             self.auth_manager: SpotifyOAuth = self.sp.auth_manager
             self.cache_handler: CacheFileHandler = self.auth_manager.cache_handler
         except Exception as e:
-            self.logger.error(f"Failed to initialize Spotify client: {str(e)}")
+            self.logger.error("Failed to initialize Spotify client: %s", e)
             raise
 
         self.username = None
+        # responses of idempotent GETs; entries are invalidated by the write methods below
+        self.cache = utils.TTLCache(ttl=300, maxsize=4096)
 
-    @utils.validate
-    def set_username(self, device=None):
-        self.username = self.sp.current_user()['display_name']
+    @utils.cached('current_user', ttl=3600)
+    def current_user(self) -> dict:
+        """Returns the profile of the authenticated user."""
+        return self.sp.current_user()
 
-    @utils.validate
-    def search(self, query: str, qtype: str = 'track', limit=10, device=None):
+    def set_username(self):
+        self.username = self.current_user()['display_name']
+
+    def search(self, query: str, qtype: str = 'track', limit=10):
         """
         Searches based of query term.
         - query: query term
@@ -63,9 +250,23 @@ class Client:
                  If multiple types are desired, pass in a comma separated string; e.g. 'track,album'
         - limit: max # items to return
         """
+        qtypes = list(dict.fromkeys(t.strip() for t in qtype.split(",")))
+        if len(qtypes) == 1:
+            return self._search(query, qtypes[0], limit)
+
+        # each type is searched (and cached) on its own, so the requests overlap
+        results = {}
+        for parsed in _executor.map(lambda t: self._search(query, t, limit), qtypes):
+            results.update(parsed)
+        return results
+
+    # queries differing only in case or spacing share one cache entry; Spotify still gets the query as typed
+    @utils.cached('search', ttl=SEARCH_TTL,
+                  key=lambda query, qtype, limit: (utils.normalize_query(query), qtype, limit))
+    def _search(self, query: str, qtype: str, limit: int):
         if self.username is None:
             self.set_username()
-        results = self.sp.search(q=query, limit=limit, type=qtype)
+        results = self.sp.search(q=query, limit=limit, type=qtype, market=MARKET)
         if not results:
             raise ValueError("No search results found.")
         return utils.parse_search_results(results, qtype, self.username)
@@ -75,6 +276,7 @@ class Client:
         recs = self.sp.recommendations(seed_artists=artists, seed_tracks=tracks, limit=limit)
         return recs
 
+    @utils.cached('info', ttl=_info_ttl)
     def get_info(self, item_uri: str) -> dict:
         """
         Returns more info about item.
@@ -83,14 +285,18 @@ class Client:
         _, qtype, item_id = item_uri.split(":")
         match qtype:
             case 'track':
-                return utils.parse_track(self.sp.track(item_id), detailed=True)
+                return utils.parse_track(self.sp.track(item_id, market=MARKET), detailed=True)
             case 'album':
-                album_info = utils.parse_album(self.sp.album(item_id), detailed=True)
+                album_info = utils.parse_album(self.sp.album(item_id, market=MARKET), detailed=True)
                 return album_info
             case 'artist':
-                artist_info = utils.parse_artist(self.sp.artist(item_id), detailed=True)
-                albums = self.sp.artist_albums(item_id)
-                top_tracks = self.sp.artist_top_tracks(item_id)['tracks']
+                # the three lookups are independent, so issue them concurrently
+                artist_f = _executor.submit(self.sp.artist, item_id)
+                albums_f = _executor.submit(self.sp.artist_albums, item_id)
+                top_tracks_f = _executor.submit(self.sp.artist_top_tracks, item_id)
+                artist_info = utils.parse_artist(artist_f.result(), detailed=True)
+                albums = albums_f.result()
+                top_tracks = top_tracks_f.result()['tracks']
                 albums_and_tracks = {
                     'albums': albums,
                     'tracks': {'items': top_tracks}
@@ -103,32 +309,42 @@ class Client:
             case 'playlist':
                 if self.username is None:
                     self.set_username()
-                playlist = self.sp.playlist(item_id)
-                self.logger.info(f"playlist info is {playlist}")
+                playlist = self.sp.playlist(item_id, fields=PLAYLIST_FIELDS, market=MARKET)
+                self.logger.debug("Fetched playlist %s with %d tracks", item_id, len(playlist['tracks']['items']))
                 playlist_info = utils.parse_playlist(playlist, self.username, detailed=True)
 
                 return playlist_info
 
         raise ValueError(f"Unknown qtype {qtype}")
 
+    def get_tracks_info(self, track_ids: List[str]) -> List[Dict]:
+        """
+        Returns detailed info about several tracks, batching lookups through Spotify's multiple-tracks endpoint.
+        - track_ids: IDs or URIs of the tracks.
+        """
+        batches = [track_ids[i:i + TRACKS_BATCH_SIZE] for i in range(0, len(track_ids), TRACKS_BATCH_SIZE)]
+        results = _executor.map(lambda batch: self.sp.tracks(batch, market=MARKET), batches)
+        return [utils.parse_track(track, detailed=True) for result in results for track in result['tracks'] if track]
+
+    @utils.cached('current_track', ttl=CURRENT_TRACK_TTL)
     def get_current_track(self) -> Optional[Dict]:
         """Get information about the currently playing track"""
         try:
             # current_playback vs current_user_playing_track?
             current = self.sp.current_user_playing_track()
             if not current:
-                self.logger.info("No playback session found")
+                self.logger.debug("No playback session found")
                 return None
             if current.get('currently_playing_type') != 'track':
-                self.logger.info("Current playback is not a track")
+                self.logger.debug("Current playback is not a track")
                 return None
 
             track_info = utils.parse_track(current['item'])
             if 'is_playing' in current:
                 track_info['is_playing'] = current['is_playing']
 
-            self.logger.info(
-                f"Current track: {track_info.get('name', 'Unknown')} by {track_info.get('artist', 'Unknown')}")
+            self.logger.debug(
+                "Current track: %s by %s", track_info.get('name', 'Unknown'), track_info.get('artist', 'Unknown'))
             return track_info
         except Exception as e:
             self.logger.error("Error getting current track info.")
@@ -141,12 +357,14 @@ class Client:
         - spotify_uri: ID of resource to play, or None. Typically looks like 'spotify:track:xxxxxx' or 'spotify:album:xxxxxx'.
         """
         try:
-            self.logger.info(f"Starting playback for spotify_uri: {spotify_uri} on {device}")
+            self.logger.debug("Starting playback for spotify_uri: %s on %s", spotify_uri, device)
             if not spotify_uri:
-                if self.is_track_playing():
+                # one read answers both "is it already playing?" and "is there anything to resume?"
+                curr_track = self.get_current_track()
+                if curr_track and curr_track.get('is_playing'):
                     self.logger.info("No track_id provided and playback already active.")
                     return
-                if not self.get_current_track():
+                if not curr_track:
                     raise ValueError("No track_id provided and no current playback to resume.")
 
             if spotify_uri is not None:
@@ -160,14 +378,15 @@ class Client:
                 uris = None
                 context_uri = None
 
-            device_id = device.get('id') if device else None
+            device_id = _device_id(device)
 
-            self.logger.info(f"Starting playback of on {device}: context_uri={context_uri}, uris={uris}")
+            self.logger.debug("Starting playback of on %s: context_uri=%s, uris=%s", device, context_uri, uris)
             result = self.sp.start_playback(uris=uris, context_uri=context_uri, device_id=device_id)
-            self.logger.info(f"Playback result: {result}")
+            self.cache.invalidate('current_track')
+            self.logger.debug("Playback result: %s", result)
             return result
         except Exception as e:
-            self.logger.error(f"Error starting playback: {str(e)}.")
+            self.logger.error("Error starting playback: %s.", e)
             raise
 
     @utils.validate
@@ -175,7 +394,8 @@ class Client:
         """Pauses playback."""
         playback = self.sp.current_playback()
         if playback and playback.get('is_playing'):
-            self.sp.pause_playback(device.get('id') if device else None)
+            self.sp.pause_playback(_device_id(device))
+            self.cache.invalidate('current_track')
 
     @utils.validate
     def add_to_queue(self, track_id: str, device=None):
@@ -183,13 +403,27 @@ class Client:
         Adds track to queue.
         - track_id: ID of track to play.
         """
-        self.sp.add_to_queue(track_id, device.get('id') if device else None)
+        self.sp.add_to_queue(track_id, _device_id(device))
+
+    @utils.validate
+    def add_tracks_to_queue(self, track_ids: List[str], device=None):
+        """
+        Adds several tracks to the queue, in order.
+        - track_ids: IDs of tracks to play.
+        """
+        # Spotify takes one track per queue request; they are sent one by one so the queue keeps their order
+        device_id = _device_id(device)
+        for track_id in track_ids:
+            self.sp.add_to_queue(track_id, device_id)
 
     @utils.validate
     def get_queue(self, device=None):
         """Returns the current queue of tracks."""
+        # the queue's own currently_playing lacks is_playing, so the current track is looked up alongside it;
+        # right after a Playback "get" that lookup is served from cache
+        current_f = _executor.submit(self.get_current_track)
         queue_info = self.sp.queue()
-        queue_info['currently_playing'] = self.get_current_track()
+        queue_info['currently_playing'] = current_f.result()
 
         queue_info['queue'] = [utils.parse_track(track) for track in queue_info.pop('queue')]
 
@@ -198,9 +432,7 @@ class Client:
     def get_liked_songs(self):
         # todo
         results = self.sp.current_user_saved_tracks()
-        for idx, item in enumerate(results['items']):
-            track = item['track']
-            print(idx, track['artists'][0]['name'], " – ", track['name'])
+        return utils.parse_tracks(results['items'])
 
     def is_track_playing(self) -> bool:
         """Returns if a track is actively playing."""
@@ -211,6 +443,7 @@ class Client:
             return True
         return False
 
+    @utils.cached('user_playlists', ttl=PLAYLIST_TTL)
     def get_current_user_playlists(self, limit=50) -> List[Dict]:
         """
         Get current user's playlists.
@@ -221,18 +454,33 @@ class Client:
             raise ValueError("No playlists found.")
         return [utils.parse_playlist(playlist, self.username) for playlist in playlists['items']]
     
+    @utils.cached('playlist_tracks', ttl=PLAYLIST_TTL)
     @utils.ensure_username
-    def get_playlist_tracks(self, playlist_id: str, limit=50) -> List[Dict]:
+    def get_playlist_tracks(self, playlist_id: str, limit=PAGE_SIZE) -> List[Dict]:
         """
         Get tracks from a playlist.
         - playlist_id: ID of the playlist to get tracks from.
         - limit: Max number of tracks to return.
         """
-        playlist = self.sp.playlist(playlist_id)
-        if not playlist:
+        first_page = self._get_playlist_page(playlist_id, limit=min(limit, PAGE_SIZE))
+        if not first_page:
             raise ValueError("No playlist found.")
-        return utils.parse_tracks(playlist['tracks']['items'])
+        items = first_page['items']
+
+        # the first page reports the total, so the remaining pages can be requested concurrently
+        end = min(first_page['total'], limit)
+        pages = _page_executor.map(
+            lambda offset: self._get_playlist_page(playlist_id, limit=min(PAGE_SIZE, end - offset), offset=offset),
+            range(PAGE_SIZE, end, PAGE_SIZE))
+        for page in pages:
+            items.extend(page['items'])
+
+        return utils.parse_tracks(items)
     
+    def _get_playlist_page(self, playlist_id: str, limit=PAGE_SIZE, offset=0) -> dict:
+        return self.sp.playlist_items(playlist_id, fields=PLAYLIST_ITEMS_FIELDS, limit=limit, offset=offset,
+                                      market=MARKET, additional_types=('track',))
+
     @utils.ensure_username
     def add_tracks_to_playlist(self, playlist_id: str, track_ids: List[str], position: Optional[int] = None):
         """
@@ -242,15 +490,25 @@ class Client:
         - position: Position to insert the tracks at (optional).
         """
         if not playlist_id:
-            raise ValueError("No playlist ID provided.")
+            raise ValueError(NO_PLAYLIST_ID_MSG)
         if not track_ids:
-            raise ValueError("No track IDs provided.")
+            raise ValueError(NO_TRACK_IDS_MSG)
         
+        i = 0
         try:
-            response = self.sp.playlist_add_items(playlist_id, track_ids, position=position)
-            self.logger.info(f"Response from adding tracks: {track_ids} to playlist {playlist_id}: {response}")
+            # sent in order, so later batches land after earlier ones when inserting at a position
+            for i in range(0, len(track_ids), PLAYLIST_WRITE_BATCH_SIZE):
+                batch = track_ids[i:i + PLAYLIST_WRITE_BATCH_SIZE]
+                response = self.sp.playlist_add_items(playlist_id, batch,
+                                                      position=None if position is None else position + i)
+                self.logger.debug("Added tracks %d-%d to playlist %s: %s", i, i + len(batch), playlist_id, response)
         except Exception as e:
-            self.logger.error(f"Error adding tracks to playlist: {str(e)}")
+            # earlier batches are already applied, so the caller must learn the playlist is partly modified
+            progress = f"{i} of {len(track_ids)} tracks were added before the error"
+            self.logger.error("Error adding tracks to playlist %s (%s): %s", playlist_id, progress, e)
+            raise _with_progress(e, progress)
+        finally:
+            self._invalidate_playlist(playlist_id)
 
     @utils.ensure_username
     def remove_tracks_from_playlist(self, playlist_id: str, track_ids: List[str]):
@@ -260,15 +518,22 @@ class Client:
         - track_ids: List of track IDs to remove.
         """
         if not playlist_id:
-            raise ValueError("No playlist ID provided.")
+            raise ValueError(NO_PLAYLIST_ID_MSG)
         if not track_ids:
-            raise ValueError("No track IDs provided.")
+            raise ValueError(NO_TRACK_IDS_MSG)
         
+        i = 0
         try:
-            response = self.sp.playlist_remove_all_occurrences_of_items(playlist_id, track_ids)
-            self.logger.info(f"Response from removing tracks: {track_ids} from playlist {playlist_id}: {response}")
+            for i in range(0, len(track_ids), PLAYLIST_WRITE_BATCH_SIZE):
+                batch = track_ids[i:i + PLAYLIST_WRITE_BATCH_SIZE]
+                response = self.sp.playlist_remove_all_occurrences_of_items(playlist_id, batch)
+                self.logger.debug("Removed tracks %d-%d from playlist %s: %s", i, i + len(batch), playlist_id, response)
         except Exception as e:
-            self.logger.error(f"Error removing tracks from playlist: {str(e)}")
+            progress = f"{i} of {len(track_ids)} tracks were removed before the error"
+            self.logger.error("Error removing tracks from playlist %s (%s): %s", playlist_id, progress, e)
+            raise _with_progress(e, progress)
+        finally:
+            self._invalidate_playlist(playlist_id)
 
     @utils.ensure_username
     def create_playlist(self, name: str, description: Optional[str] = None, public: bool = True):
@@ -282,7 +547,7 @@ class Client:
             raise ValueError("Playlist name is required.")
         
         try:
-            user = self.sp.current_user()
+            user = self.current_user()
             user_id = user['id']
             
             playlist = self.sp.user_playlist_create(
@@ -291,10 +556,11 @@ class Client:
                 public=public,
                 description=description
             )
-            self.logger.info(f"Created playlist: {name} (ID: {playlist['id']})")
+            self.logger.info("Created playlist: %s (ID: %s)", name, playlist['id'])
+            self.cache.invalidate('user_playlists')
             return utils.parse_playlist(playlist, self.username, detailed=True)
         except Exception as e:
-            self.logger.error(f"Error creating playlist: {str(e)}")
+            self.logger.error("Error creating playlist: %s", e)
             raise
 
     @utils.ensure_username
@@ -307,54 +573,73 @@ class Client:
         - description: New description for the playlist.
         """
         if not playlist_id:
-            raise ValueError("No playlist ID provided.")
+            raise ValueError(NO_PLAYLIST_ID_MSG)
         
         try:
             response = self.sp.playlist_change_details(playlist_id, name=name, description=description)
-            self.logger.info(f"Response from changing playlist details: {response}")
+            self.logger.debug("Response from changing playlist details: %s", response)
+            self._invalidate_playlist(playlist_id)
         except Exception as e:
-            self.logger.error(f"Error changing playlist details: {str(e)}")
+            self.logger.error("Error changing playlist details: %s", e)
        
-    def get_devices(self) -> dict:
+    def _invalidate_playlist(self, playlist_id: str):
+        """Drops cached reads that include the given playlist."""
+        self.cache.invalidate('info', f"spotify:playlist:{playlist_id}")
+        self.cache.invalidate('playlist_tracks', playlist_id)
+        self.cache.invalidate('user_playlists')
+
+    @utils.cached('devices', ttl=DEVICES_TTL)
+    def get_devices(self) -> List[dict]:
         return self.sp.devices()['devices']
 
     def is_active_device(self):
-        return any([device.get('is_active') for device in self.get_devices()])
+        return any(device.get('is_active') for device in self.get_devices())
 
-    def _get_candidate_device(self):
-        devices = self.get_devices()
+    def _get_candidate_device(self, devices: Optional[List[Dict]] = None):
+        if devices is None:
+            devices = self.get_devices()
         if not devices:
-            raise ConnectionError("No active device. Is Spotify open?")
+            raise ConnectionError(NO_ACTIVE_DEVICE_MSG)
         for device in devices:
             if device.get('is_active'):
                 return device
-        self.logger.info(f"No active device, assigning {devices[0]['name']}.")
+        self.logger.info("No active device, assigning %s.", devices[0]['name'])
         return devices[0]
 
     def auth_ok(self) -> bool:
         try:
             token = self.cache_handler.get_cached_token()
             if token is None:
-                self.logger.info("Auth check result: no token exists")
+                self.logger.debug("Auth check result: no token exists")
                 return False
                 
             is_expired = self.auth_manager.is_token_expired(token)
-            self.logger.info(f"Auth check result: {'valid' if not is_expired else 'expired'}")
+            self.logger.debug("Auth check result: %s", 'valid' if not is_expired else 'expired')
             return not is_expired  # Return True if token is NOT expired
         except Exception as e:
-            self.logger.error(f"Error checking auth status: {str(e)}")
+            self.logger.error("Error checking auth status: %s", e)
             return False  # Return False on error rather than raising
 
     def auth_refresh(self):
         self.auth_manager.validate_token(self.cache_handler.get_cached_token())
 
-    def skip_track(self, n=1):
+    def skip_track(self, n=1) -> int:
+        """Skips n tracks and returns how many were actually skipped."""
         # todo: Better error handling
-        for _ in range(n):
-            self.sp.next_track()
+        # Each skip is its own request, so bound n to keep a bad argument from flooding the API.
+        # Jumping straight to the n-th queued track would take one request, but starting playback
+        # of a single uri replaces the current album/playlist context.
+        skips = max(1, min(MAX_SKIPS, n))
+        try:
+            for _ in range(skips):
+                self.sp.next_track()
+        finally:
+            self.cache.invalidate('current_track')
+        return skips
 
     def previous_track(self):
         self.sp.previous_track()
+        self.cache.invalidate('current_track')
 
     def seek_to_position(self, position_ms):
         self.sp.seek_track(position_ms=position_ms)
@@ -1,14 +1,50 @@
 from collections import defaultdict
 from typing import Optional, Dict
 import functools
-from typing import Callable, TypeVar
-from typing import Optional, Dict
+import inspect
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Hashable, TypeVar
 from urllib.parse import quote, urlparse, urlunparse
 
-from requests import RequestException
+try:
+    import orjson
+except ImportError:  # optional speedup, falls back to the stdlib encoder
+    orjson = None
 
 T = TypeVar('T')
 
+# Responses are read by the model, so they are sent compact; set SPOTIFY_MCP_PRETTY=1 to indent them for debugging
+PRETTY_JSON = os.getenv("SPOTIFY_MCP_PRETTY") == "1"
+
+
+def dumps(obj) -> str:
+    """Serializes a Spotify response to JSON text, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if PRETTY_JSON else None).decode()
+    if PRETTY_JSON:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+def loads(text: str):
+    """Parses JSON text, using orjson when it is installed. Invalid input raises json.JSONDecodeError."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def orjson_response_hook(response, *args, **kwargs):
+    """
+    requests response hook that decodes JSON bodies with orjson instead of the stdlib parser.
+    spotipy reads every payload through response.json(), so this speeds up large playlist/search pages.
+    """
+    content = response.content
+    response.json = lambda **_: orjson.loads(content)
+    return response
+
 
 def normalize_redirect_uri(url: str) -> str:
     if not url:
@@ -44,9 +80,10 @@ def parse_track(track_item: dict, detailed=False) -> Optional[dict]:
     if not track_item.get('is_playable', True):
         narrowed_item['is_playable'] = False
 
-    artists = [a['name'] for a in track_item['artists']]
     if detailed:
         artists = [parse_artist(a) for a in track_item['artists']]
+    else:
+        artists = [a['name'] for a in track_item['artists']]
 
     if len(artists) == 1:
         narrowed_item['artist'] = artists[0]
@@ -81,10 +118,7 @@ def parse_playlist(playlist_item: dict, username, detailed=False) -> Optional[di
     }
     if detailed:
         narrowed_item['description'] = playlist_item.get('description')
-        tracks = []
-        for t in playlist_item['tracks']['items']:
-            tracks.append(parse_track(t['track']))
-        narrowed_item['tracks'] = tracks
+        narrowed_item['tracks'] = [parse_track(t['track']) for t in playlist_item['tracks']['items']]
 
     return narrowed_item
 
@@ -95,17 +129,14 @@ def parse_album(album_item: dict, detailed=False) -> dict:
         'id': album_item['id'],
     }
 
-    artists = [a['name'] for a in album_item['artists']]
-
     if detailed:
-        tracks = []
-        for t in album_item['tracks']['items']:
-            tracks.append(parse_track(t))
-        narrowed_item["tracks"] = tracks
+        narrowed_item["tracks"] = [parse_track(t) for t in album_item['tracks']['items']]
         artists = [parse_artist(a) for a in album_item['artists']]
 
         for k in ['total_tracks', 'release_date', 'genres']:
             narrowed_item[k] = album_item.get(k)
+    else:
+        artists = [a['name'] for a in album_item['artists']]
 
     if len(artists) == 1:
         narrowed_item['artist'] = artists[0]
@@ -124,21 +155,13 @@ def parse_search_results(results: Dict, qtype: str, username: Optional[str] = No
     for q in qtype.split(","):
         match q:
             case "track":
-                for idx, item in enumerate(results['tracks']['items']):
-                    if not item: continue
-                    _results['tracks'].append(parse_track(item))
+                _results['tracks'].extend(parse_track(item) for item in results['tracks']['items'] if item)
             case "artist":
-                for idx, item in enumerate(results['artists']['items']):
-                    if not item: continue
-                    _results['artists'].append(parse_artist(item))
+                _results['artists'].extend(parse_artist(item) for item in results['artists']['items'] if item)
             case "playlist":
-                for idx, item in enumerate(results['playlists']['items']):
-                    if not item: continue
-                    _results['playlists'].append(parse_playlist(item, username))
+                _results['playlists'].extend(parse_playlist(item, username) for item in results['playlists']['items'] if item)
             case "album":
-                for idx, item in enumerate(results['albums']['items']):
-                    if not item: continue
-                    _results['albums'].append(parse_album(item))
+                _results['albums'].extend(parse_album(item) for item in results['albums']['items'] if item)
             case _:
                 raise ValueError(f"Unknown qtype {qtype}")
 
@@ -153,12 +176,15 @@ def parse_tracks(items: Dict) -> list:
     Returns:
         List of parsed tracks
     """ 
-    tracks = []
-    for idx, item in enumerate(items):
-        if not item:
-            continue
-        tracks.append(parse_track(item['track']))
-    return tracks
+    return [parse_track(item['track']) for item in items if item]
+
+
+def normalize_query(query: str) -> str:
+    """
+    Folds a search query to the form used as its cache key: case and runs of whitespace are ignored,
+    except for the NOT/OR operators, which Spotify only honours in uppercase.
+    """
+    return " ".join(word if word in ("NOT", "OR") else word.lower() for word in query.split())
 
 
 def build_search_query(base_query: str,
@@ -226,9 +252,12 @@ def validate(func: Callable[..., T]) -> Callable[..., T]:
         if not self.auth_ok():
             self.auth_refresh()
 
-        # Handle device validation
-        if not self.is_active_device():
-            kwargs['device'] = self._get_candidate_device()
+        # Handle device validation, reusing one device listing for both the check and the fallback
+        devices = self.get_devices()
+        if not any(device.get('is_active') for device in devices):
+            # playing on a candidate device activates it, so the cached listing goes stale
+            self.cache.invalidate('devices')
+            kwargs['device'] = self._get_candidate_device(devices)
 
         # TODO: try-except RequestException
         return func(self, *args, **kwargs)
@@ -245,3 +274,102 @@ def ensure_username(func):
             self.set_username()
         return func(self, *args, **kwargs)
     return wrapper
+
+
+class TTLCache:
+    """
+    Thread-safe in-memory cache whose entries expire after a time-to-live.
+    - ttl: default lifetime of an entry in seconds.
+    - maxsize: max # entries; the oldest entry is evicted when full.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: Dict[Hashable, tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default=None):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return default
+            return value
+
+    def set(self, key: Hashable, value, ttl: Optional[float] = None):
+        with self._lock:
+            if key not in self._data and len(self._data) >= self.maxsize:
+                del self._data[next(iter(self._data))]
+            self._data[key] = (time.monotonic() + (ttl or self.ttl), value)
+
+    def invalidate(self, kind: str, *args):
+        """Drops every entry whose key starts with (kind, *args)."""
+        prefix = (kind, *args)
+        with self._lock:
+            for key in [k for k in self._data if k[:len(prefix)] == prefix]:
+                del self._data[key]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket that spaces calls out to an average rate.
+    - rate: calls allowed per second on average.
+    - burst: max # calls allowed back to back after an idle period.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Blocks until the caller may proceed."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # each caller reserves a token, going into debt if none is left, and sleeps off its share of the debt
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+        if wait:
+            time.sleep(wait)
+
+
+def cached(kind: str, ttl: Optional[float | Callable[..., float]] = None,
+           key: Optional[Callable[..., tuple]] = None):
+    """
+    Decorator for read-only Spotify API methods that memoizes results in the client's TTL cache.
+    Entries are keyed by (kind, *arguments), so they can be dropped with `cache.invalidate(kind, ...)`.
+    - ttl: lifetime in seconds, or a function of the call's arguments returning one. Defaults to the cache's ttl.
+    - key: function of the call's arguments returning the tuple to key on instead, e.g. to normalize them.
+    """
+
+    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            arguments = list(bound.arguments.values())[1:]
+            cache_key = (kind, *(key(*arguments) if key else arguments))
+
+            result = self.cache.get(cache_key)
+            if result is None:
+                result = func(self, *args, **kwargs)
+                self.cache.set(cache_key, result, ttl(*arguments) if callable(ttl) else ttl)
+            return result
+
+        return wrapper
+
+    return decorator